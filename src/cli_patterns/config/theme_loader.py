@@ -13,10 +13,28 @@ from typing import Any
 
 import yaml  # type: ignore[import-untyped]
 
+try:
+    # The LibYAML-backed loader is much faster; PyYAML builds without LibYAML
+    # only ship the pure-Python one.
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment,unused-ignore]
+
 from ..ui.design.registry import theme_registry
 from ..ui.design.themes import Theme
 from ..ui.design.tokens import CategoryToken, EmphasisToken, HierarchyToken, StatusToken
 
+_PARSE_CACHE_MAXSIZE = 128
+"""Maximum number of parsed theme files kept by the parse cache."""
+
+_PARSE_CACHE: dict[tuple[str, int, int], Any] = {}
+"""Parsed YAML documents keyed by (resolved path, st_mtime_ns, st_size).
+
+Only the parsed document is cached, not the Theme built from it: themes are
+mutable and registered by reference, and an ``extends`` theme depends on the
+registry state at load time, so a fresh Theme is built on every call.
+"""
+
 
 class ThemeLoadError(Exception):
     """Raised when theme loading fails."""
@@ -24,6 +42,48 @@ class ThemeLoadError(Exception):
     pass
 
 
+def clear_theme_cache() -> None:
+    """Forget all parsed theme files, forcing the next load to re-read them."""
+    _PARSE_CACHE.clear()
+
+
+def _parse_theme_file(path: Path) -> Any:
+    """Parse a theme YAML file, reusing the result while the file is unchanged.
+
+    Args:
+        path: Path to the YAML theme file
+
+    Returns:
+        The parsed YAML document (treated as read-only by callers)
+
+    Raises:
+        ThemeLoadError: If the file is not valid YAML
+        FileNotFoundError: If the theme file does not exist
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Theme file not found: {path}") from None
+
+    # Resolve the path so a relative name is tied to the file it refers to,
+    # not to whatever the working directory happens to be.
+    key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+    if key in _PARSE_CACHE:
+        return _PARSE_CACHE[key]
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = yaml.load(f, Loader=_SafeLoader)
+    except yaml.YAMLError as e:
+        raise ThemeLoadError(f"Invalid YAML in theme file {path}: {e}") from e
+
+    if len(_PARSE_CACHE) >= _PARSE_CACHE_MAXSIZE:
+        # Dicts keep insertion order, so this evicts the oldest entry
+        del _PARSE_CACHE[next(iter(_PARSE_CACHE))]
+    _PARSE_CACHE[key] = data
+    return data
+
+
 def _validate_token_mappings(data: dict[str, Any]) -> None:
     """Validate that all required token mappings are present.
 
@@ -70,6 +130,9 @@ def _validate_token_mappings(data: dict[str, Any]) -> None:
 def load_theme_from_yaml(path: Path | str) -> Theme:
     """Load a theme from a YAML file.
 
+    The parsed file is cached by modification time and size, so loading an
+    unchanged file again skips the YAML parse.
+
     Args:
         path: Path to the YAML theme file (string or Path object)
 
@@ -82,14 +145,7 @@ def load_theme_from_yaml(path: Path | str) -> Theme:
     """
     if isinstance(path, str):
         path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"Theme file not found: {path}")
-
-    try:
-        with open(path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-    except yaml.YAMLError as e:
-        raise ThemeLoadError(f"Invalid YAML in theme file {path}: {e}") from e
+    data = _parse_theme_file(path)
 
     if not isinstance(data, dict):
         raise ThemeLoadError(f"Theme file {path} must contain a dictionary")
@@ -48,9 +48,13 @@ class BaseConfig(StrictModel):
     """Base configuration providing common fields for all config types.
 
     This class provides metadata and tagging infrastructure that all
-    configuration types can use.
+    configuration types can use. Configurations are frozen once validated,
+    so fields such as BashActionConfig.command can't be changed afterwards
+    without going through validation again.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     metadata: dict[str, Any] = Field(default_factory=dict)
     """Arbitrary metadata for extensions and tooling."""
 
@@ -63,6 +67,28 @@ class BaseConfig(StrictModel):
 # ============================================================================
 
 
+# Shell features rejected when allow_shell_features=False, as
+# (group name, pattern, description). They are fused into one alternation so a
+# command is scanned once; the matching group names the offending feature.
+_SHELL_FEATURES = (
+    ("chaining", r"[;&|]", "command chaining (;, &, |)"),
+    ("backticks", r"`", "command substitution (backticks)"),
+    ("substitution", r"\$\(", "command substitution ($())"),
+    ("redirection", r"[<>]", "redirection (<, >)"),
+    ("expansion", r"\$\{", "variable expansion (${})"),
+    ("assignment", r"^\s*\w+\s*=", "variable assignment"),
+)
+_SHELL_FEATURE_RE = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern, _ in _SHELL_FEATURES)
+)
+_SHELL_FEATURE_DESCRIPTIONS = {
+    name: description for name, _, description in _SHELL_FEATURES
+}
+# Every pattern above needs one of these characters to match, so commands
+# without any of them (the common case) skip the regex entirely.
+_SHELL_FEATURE_CHARS = frozenset(";&|`$<>=")
+
+
 class BashActionConfig(BaseConfig):
     """Configuration for bash command actions.
 
@@ -105,24 +131,17 @@ class BashActionConfig(BaseConfig):
         Raises:
             ValueError: If command contains dangerous shell metacharacters
         """
-        if not self.allow_shell_features:
-            # Dangerous shell metacharacters
-            dangerous_patterns = [
-                (r"[;&|]", "command chaining (;, &, |)"),
-                (r"`", "command substitution (backticks)"),
-                (r"\$\(", "command substitution ($())"),
-                (r"[<>]", "redirection (<, >)"),
-                (r"\$\{", "variable expansion (${})"),
-                (r"^\s*\w+\s*=", "variable assignment"),
-            ]
-
-            for pattern, description in dangerous_patterns:
-                if re.search(pattern, self.command):
-                    raise ValueError(
-                        f"Command contains {description}. "
-                        f"Set allow_shell_features=True to enable shell features "
-                        f"(SECURITY RISK: only do this for trusted commands)."
-                    )
+        if self.allow_shell_features or _SHELL_FEATURE_CHARS.isdisjoint(self.command):
+            return self
+
+        match = _SHELL_FEATURE_RE.search(self.command)
+        if match and match.lastgroup:
+            description = _SHELL_FEATURE_DESCRIPTIONS[match.lastgroup]
+            raise ValueError(
+                f"Command contains {description}. "
+                f"Set allow_shell_features=True to enable shell features "
+                f"(SECURITY RISK: only do this for trusted commands)."
+            )
 
         return self
 
@@ -250,6 +269,8 @@ class MenuConfig(StrictModel):
     Menus allow tree-based navigation between branches.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: MenuId = Field(description="Unique menu identifier")
     label: str = Field(description="Menu item label displayed to user")
     target: BranchId = Field(description="Target branch to navigate to")
@@ -288,31 +309,29 @@ class BranchConfig(BaseConfig):
         default_factory=list, description="Navigation menus in this branch"
     )
 
-    @field_validator("actions")
+    # Size checks run before item validation so oversized lists are rejected
+    # without validating every item first.
+    @field_validator("actions", mode="before")
     @classmethod
-    def validate_actions_size(
-        cls, v: list[ActionConfigUnion]
-    ) -> list[ActionConfigUnion]:
+    def validate_actions_size(cls, v: Any) -> Any:
         """Validate number of actions is reasonable."""
-        if len(v) > 100:
+        if isinstance(v, list) and len(v) > 100:
             raise ValueError("Too many actions in branch (maximum: 100)")
         return v
 
-    @field_validator("options")
+    @field_validator("options", mode="before")
     @classmethod
-    def validate_options_size(
-        cls, v: list[OptionConfigUnion]
-    ) -> list[OptionConfigUnion]:
+    def validate_options_size(cls, v: Any) -> Any:
         """Validate number of options is reasonable."""
-        if len(v) > 50:
+        if isinstance(v, list) and len(v) > 50:
             raise ValueError("Too many options in branch (maximum: 50)")
         return v
 
-    @field_validator("menus")
+    @field_validator("menus", mode="before")
     @classmethod
-    def validate_menus_size(cls, v: list[MenuConfig]) -> list[MenuConfig]:
+    def validate_menus_size(cls, v: Any) -> Any:
         """Validate number of menus is reasonable."""
-        if len(v) > 20:
+        if isinstance(v, list) and len(v) > 20:
             raise ValueError("Too many menus in branch (maximum: 20)")
         return v
 
@@ -340,19 +359,22 @@ class WizardConfig(BaseConfig):
     )
     branches: list[BranchConfig] = Field(description="All branches in the wizard tree")
 
-    @field_validator("branches")
+    # Runs before item validation, like the BranchConfig size checks
+    @field_validator("branches", mode="before")
     @classmethod
-    def validate_branches_size(cls, v: list[BranchConfig]) -> list[BranchConfig]:
+    def validate_branches_size(cls, v: Any) -> Any:
         """Validate number of branches is reasonable."""
-        if len(v) > 100:
+        if isinstance(v, list) and len(v) > 100:
             raise ValueError("Too many branches in wizard (maximum: 100)")
         return v
 
     @model_validator(mode="after")
     def validate_entry_branch_exists(self) -> WizardConfig:
         """Validate that entry_branch exists in branches list."""
-        branch_ids = {b.id for b in self.branches}
-        if self.entry_branch not in branch_ids:
+        # The entry branch is usually listed first, so scan instead of building
+        # a set of every branch ID; the set is only needed for the error.
+        if not any(b.id == self.entry_branch for b in self.branches):
+            branch_ids = {b.id for b in self.branches}
             raise ValueError(
                 f"entry_branch '{self.entry_branch}' not found in branches. "
                 f"Available branches: {sorted(branch_ids)}"
@@ -400,11 +422,11 @@ class SessionState(StrictModel):
         default_factory=list, description="Command history for readline/recall"
     )
 
-    @field_validator("option_values")
+    # The state validators run before field validation, so an oversized dict is
+    # rejected from its length alone instead of after checking every key.
+    @field_validator("option_values", mode="before")
     @classmethod
-    def validate_option_values(
-        cls, v: dict[OptionKey, StateValue]
-    ) -> dict[OptionKey, StateValue]:
+    def validate_option_values(cls, v: Any) -> Any:
         """Validate all option values meet safety requirements.
 
         Checks each value for:
@@ -412,7 +434,7 @@ class SessionState(StrictModel):
         - Maximum collection size (1000 items)
 
         Args:
-            v: Option values dict to validate
+            v: Raw option values to validate; non-dicts are left to field validation
 
         Returns:
             Validated dict
@@ -420,6 +442,9 @@ class SessionState(StrictModel):
         Raises:
             ValueError: If any value violates safety limits
         """
+        if not isinstance(v, dict):
+            return v
+
         # Check total number of options
         if len(v) > 1000:
             raise ValueError("Too many options (maximum: 1000)")
@@ -433,9 +458,9 @@ class SessionState(StrictModel):
 
         return v
 
-    @field_validator("variables")
+    @field_validator("variables", mode="before")
     @classmethod
-    def validate_variables(cls, v: dict[str, StateValue]) -> dict[str, StateValue]:
+    def validate_variables(cls, v: Any) -> Any:
         """Validate all variables meet safety requirements.
 
         Checks each value for:
@@ -443,7 +468,7 @@ class SessionState(StrictModel):
         - Maximum collection size (1000 items)
 
         Args:
-            v: Variables dict to validate
+            v: Raw variables to validate; non-dicts are left to field validation
 
         Returns:
             Validated dict
@@ -451,6 +476,9 @@ class SessionState(StrictModel):
         Raises:
             ValueError: If any value violates safety limits
         """
+        if not isinstance(v, dict):
+            return v
+
         if len(v) > 1000:
             raise ValueError("Too many variables (maximum: 1000)")
 
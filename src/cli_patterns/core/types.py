@@ -21,6 +21,8 @@ from typing import Any, NewType, Optional, Union
 
 from typing_extensions import TypeGuard
 
+from cli_patterns.core.config import get_config
+
 # JSON-compatible types for state values
 JsonPrimitive = Union[str, int, float, bool, None]
 JsonValue = Union[JsonPrimitive, list["JsonValue"], dict[str, "JsonValue"]]
@@ -62,6 +64,33 @@ MenuList = list[MenuId]
 """Type alias for lists of menu IDs."""
 
 
+_MAX_IDENTIFIER_LENGTH = 100
+"""Maximum length of a validated semantic identifier."""
+
+
+def _validate_identifier(value: str, type_name: str) -> None:
+    """Validate a string used as a semantic identifier.
+
+    Shared by the make_* factories; only called when validation is enabled.
+    Deliberately not memoized: these checks are cheaper than an lru_cache
+    lookup, which has to hash the (value, type_name) key.
+
+    Args:
+        value: String value to validate
+        type_name: Semantic type name used in error messages
+
+    Raises:
+        ValueError: If value is empty, whitespace-only, or too long
+    """
+    # isspace() checks in place; strip() would allocate a copy of the value
+    if not value or value.isspace():
+        raise ValueError(f"{type_name} cannot be empty")
+    if len(value) > _MAX_IDENTIFIER_LENGTH:
+        raise ValueError(
+            f"{type_name} is too long (max {_MAX_IDENTIFIER_LENGTH} characters)"
+        )
+
+
 # Factory functions for creating semantic types
 def make_branch_id(value: str, validate: Optional[bool] = None) -> BranchId:
     """Create a BranchId from a string value.
@@ -77,16 +106,10 @@ def make_branch_id(value: str, validate: Optional[bool] = None) -> BranchId:
         ValueError: If validate=True and value is invalid
     """
     if validate is None:
-        # Import here to avoid circular dependency
-        from cli_patterns.core.config import get_config
-
         validate = get_config()["enable_validation"]
 
     if validate:
-        if not value or not value.strip():
-            raise ValueError("BranchId cannot be empty")
-        if len(value) > 100:
-            raise ValueError("BranchId is too long (max 100 characters)")
+        _validate_identifier(value, "BranchId")
     return BranchId(value)
 
 
@@ -104,15 +127,10 @@ def make_action_id(value: str, validate: Optional[bool] = None) -> ActionId:
         ValueError: If validate=True and value is invalid
     """
     if validate is None:
-        from cli_patterns.core.config import get_config
-
         validate = get_config()["enable_validation"]
 
     if validate:
-        if not value or not value.strip():
-            raise ValueError("ActionId cannot be empty")
-        if len(value) > 100:
-            raise ValueError("ActionId is too long (max 100 characters)")
+        _validate_identifier(value, "ActionId")
     return ActionId(value)
 
 
@@ -130,15 +148,10 @@ def make_option_key(value: str, validate: Optional[bool] = None) -> OptionKey:
         ValueError: If validate=True and value is invalid
     """
     if validate is None:
-        from cli_patterns.core.config import get_config
-
         validate = get_config()["enable_validation"]
 
     if validate:
-        if not value or not value.strip():
-            raise ValueError("OptionKey cannot be empty")
-        if len(value) > 100:
-            raise ValueError("OptionKey is too long (max 100 characters)")
+        _validate_identifier(value, "OptionKey")
     return OptionKey(value)
 
 
@@ -156,15 +169,10 @@ def make_menu_id(value: str, validate: Optional[bool] = None) -> MenuId:
         ValueError: If validate=True and value is invalid
     """
     if validate is None:
-        from cli_patterns.core.config import get_config
-
         validate = get_config()["enable_validation"]
 
     if validate:
-        if not value or not value.strip():
-            raise ValueError("MenuId cannot be empty")
-        if len(value) > 100:
-            raise ValueError("MenuId is too long (max 100 characters)")
+        _validate_identifier(value, "MenuId")
     return MenuId(value)
 
 
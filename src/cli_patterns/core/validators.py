@@ -10,17 +10,18 @@ and ensure data integrity:
 
 from __future__ import annotations
 
-from typing import Any
+import sys
+from typing import Any, Final, Optional
 
 # Configuration constants
-MAX_JSON_DEPTH = 50
+MAX_JSON_DEPTH: Final = 50
 """Maximum nesting depth for JSON-serializable values.
 
 This prevents stack overflow during serialization and CPU exhaustion
 during parsing. Default: 50 levels.
 """
 
-MAX_COLLECTION_SIZE = 1000
+MAX_COLLECTION_SIZE: Final = 1000
 """Maximum total number of items in collections (lists, dicts).
 
 This prevents memory exhaustion from excessively large data structures.
@@ -57,28 +58,7 @@ def validate_json_depth(value: Any, max_depth: int = MAX_JSON_DEPTH) -> None:
         >>> validate_json_depth({"a": {"b": {"c": 1}}})  # OK
         >>> validate_json_depth(create_deeply_nested(100))  # Raises ValidationError
     """
-
-    def check_depth(obj: Any, current_depth: int = 0) -> int:
-        """Recursively check nesting depth."""
-        if current_depth > max_depth:
-            raise ValidationError(
-                f"JSON nesting too deep: {current_depth} levels "
-                f"(maximum: {max_depth})"
-            )
-
-        if isinstance(obj, dict):
-            if not obj:  # Empty dict is depth 0
-                return current_depth
-            return max(check_depth(v, current_depth + 1) for v in obj.values())
-        elif isinstance(obj, list):
-            if not obj:  # Empty list is depth 0
-                return current_depth
-            return max(check_depth(item, current_depth + 1) for item in obj)
-        else:
-            # Primitive value
-            return current_depth
-
-    check_depth(value)
+    _check_limits(value, max_depth=max_depth)
 
 
 def validate_collection_size(value: Any, max_size: int = MAX_COLLECTION_SIZE) -> None:
@@ -98,39 +78,7 @@ def validate_collection_size(value: Any, max_size: int = MAX_COLLECTION_SIZE) ->
         >>> validate_collection_size([1, 2, 3])  # OK
         >>> validate_collection_size([1] * 10000)  # Raises ValidationError
     """
-
-    def check_size(obj: Any) -> int:
-        """Recursively count total elements."""
-        count = 0
-
-        if isinstance(obj, dict):
-            count += len(obj)
-            if count > max_size:
-                raise ValidationError(
-                    f"Collection too large: {count} items (maximum: {max_size})"
-                )
-            for v in obj.values():
-                count += check_size(v)
-                if count > max_size:
-                    raise ValidationError(
-                        f"Collection too large: {count} items (maximum: {max_size})"
-                    )
-        elif isinstance(obj, list):
-            count += len(obj)
-            if count > max_size:
-                raise ValidationError(
-                    f"Collection too large: {count} items (maximum: {max_size})"
-                )
-            for item in obj:
-                count += check_size(item)
-                if count > max_size:
-                    raise ValidationError(
-                        f"Collection too large: {count} items (maximum: {max_size})"
-                    )
-
-        return count
-
-    check_size(value)
+    _check_limits(value, max_size=max_size)
 
 
 def validate_state_value(value: Any) -> None:
@@ -154,5 +102,54 @@ def validate_state_value(value: Any) -> None:
         >>> validate_state_value({"user": {"name": "test", "age": 30}})  # OK
         >>> validate_state_value(create_huge_dict())  # Raises ValidationError
     """
-    validate_json_depth(value)
-    validate_collection_size(value)
+    _check_limits(value, max_depth=MAX_JSON_DEPTH, max_size=MAX_COLLECTION_SIZE)
+
+
+def _check_limits(
+    value: Any, max_depth: Optional[int] = None, max_size: Optional[int] = None
+) -> None:
+    """Walk a JSON value once, enforcing the depth and/or size limits given.
+
+    The walk is iterative, so adversarial nesting can't hit the recursion
+    limit, and it stops at the first violation. Only containers are pushed:
+    primitives add no depth or size of their own.
+
+    Args:
+        value: Value to validate
+        max_depth: Maximum nesting depth, or None to skip the depth check
+        max_size: Maximum total items, or None to skip the size check
+
+    Raises:
+        ValidationError: If either limit is exceeded
+    """
+    # Resolve everything the loop reads into locals once, so each iteration
+    # does fast local lookups instead of None checks and global loads.
+    depth_limit = sys.maxsize if max_depth is None else max_depth
+    size_limit = sys.maxsize if max_size is None else max_size
+    containers = (dict, list)
+    count = 0
+    stack: list[tuple[Any, int]] = [(value, 0)]
+    pop = stack.pop
+    while stack:
+        obj, depth = pop()
+        if isinstance(obj, dict):
+            children: Any = obj.values()
+        elif isinstance(obj, list):
+            children = obj
+        else:
+            continue
+
+        if not children:  # Empty containers add no depth
+            continue
+        if depth >= depth_limit:
+            raise ValidationError(
+                f"JSON nesting too deep: {depth + 1} levels (maximum: {depth_limit})"
+            )
+        count += len(children)
+        if count > size_limit:
+            raise ValidationError(
+                f"Collection too large: {count} items (maximum: {size_limit})"
+            )
+        stack.extend(
+            (child, depth + 1) for child in children if isinstance(child, containers)
+        )
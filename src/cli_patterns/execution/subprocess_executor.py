@@ -16,7 +16,9 @@ import asyncio
 import logging
 import os
 import shlex
-from typing import Optional, Union
+import sys
+from collections.abc import Awaitable
+from typing import Any, Optional, Union
 
 from rich.console import Console
 from rich.text import Text
@@ -27,10 +29,36 @@ from ..ui.design.tokens import StatusToken
 
 logger = logging.getLogger(__name__)
 
+_STREAM_CHUNK_SIZE = 64 * 1024
+"""Maximum bytes taken from a pipe per read while streaming output.
+
+StreamReader.read(n) returns whatever is already buffered (up to n), so a
+large chunk size doesn't delay display; it just needs fewer awaits when a
+command produces a lot of output.
+"""
+
+
+async def _gather_with_timeout(timeout: float, *aws: Awaitable[Any]) -> None:
+    """Await all of ``aws``, raising asyncio.TimeoutError after ``timeout``.
+
+    On Python 3.11+ this uses the asyncio.timeout() context manager, which
+    cancels the current task in place instead of wrapping the gather in the
+    extra task and timer callback that asyncio.wait_for() needs.
+    """
+    if sys.version_info >= (3, 11):
+        async with asyncio.timeout(timeout):
+            await asyncio.gather(*aws)
+    else:
+        await asyncio.wait_for(asyncio.gather(*aws), timeout=timeout)
+
 
 class CommandResult:
     """Result of a command execution."""
 
+    # Results can be kept around (e.g. in a history), so skip the per-instance
+    # __dict__
+    __slots__ = ("exit_code", "stdout", "stderr", "timed_out", "interrupted")
+
     def __init__(
         self,
         exit_code: int,
@@ -99,6 +127,7 @@ class SubprocessExecutor:
             allow_shell_features: Allow shell features (pipes, redirects, etc.).
                 SECURITY WARNING: Only enable for trusted commands. When False,
                 command is executed without shell to prevent injection attacks.
+                Ignored for list commands, which are always executed directly.
 
         Returns:
             CommandResult with exit code and captured output
@@ -131,10 +160,9 @@ class SubprocessExecutor:
             running_style = theme_registry.resolve(StatusToken.RUNNING)
             self.console.print(Text(f"Running: {command_str}", style=running_style))
 
-        # Merge environment variables
-        process_env = os.environ.copy()
-        if env:
-            process_env.update(env)
+        # Merge environment variables. Without overrides the child inherits
+        # os.environ as-is (env=None), which avoids copying it per command.
+        process_env = {**os.environ, **env} if env else None
 
         # Capture output
         stdout_lines: list[str] = []
@@ -145,8 +173,9 @@ class SubprocessExecutor:
         process = None  # Initialize process variable
 
         try:
-            # Create subprocess - use shell only if explicitly allowed
-            if allow_shell_features:
+            # Create subprocess - use shell only if explicitly allowed. A list
+            # is already an argv, so it never needs a shell to split it.
+            if allow_shell_features and not isinstance(command, list):
                 # SECURITY WARNING: Shell features enabled
                 logger.warning(
                     f"Executing command with shell features enabled: {command_str}"
@@ -179,19 +208,14 @@ class SubprocessExecutor:
                     env=process_env,
                 )
 
-            # Create tasks for reading streams
-            stdout_task = asyncio.create_task(
-                self._read_stream(process.stdout, stdout_lines, is_stderr=False)
-            )
-            stderr_task = asyncio.create_task(
-                self._read_stream(process.stderr, stderr_lines, is_stderr=True)
-            )
-
-            # Wait for process with timeout
+            # Wait for the process and drain both pipes concurrently. On timeout
+            # the gather is cancelled, which cancels the readers with it.
             try:
-                await asyncio.wait_for(
-                    asyncio.gather(process.wait(), stdout_task, stderr_task),
-                    timeout=timeout,
+                await _gather_with_timeout(
+                    timeout,
+                    process.wait(),
+                    self._read_stream(process.stdout, stdout_lines, is_stderr=False),
+                    self._read_stream(process.stderr, stderr_lines, is_stderr=True),
                 )
                 exit_code = process.returncode or 0
             except asyncio.TimeoutError:
@@ -271,6 +295,9 @@ class SubprocessExecutor:
     ) -> None:
         """Read from a stream line by line and display with theming.
 
+        When output isn't streamed, the stream is collected whole and decoded
+        and split into lines once at the end.
+
         Args:
             stream: The asyncio stream to read from
             lines: List to append lines to
@@ -280,38 +307,49 @@ class SubprocessExecutor:
             return
 
         decoder_errors = "replace"  # Handle binary output gracefully
-        buffer = b""
+        buffer = bytearray()
 
         try:
+            if not self.stream_output:
+                try:
+                    while True:
+                        chunk = await stream.read(_STREAM_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        buffer += chunk
+                finally:
+                    # Runs on timeout too, so output read before the reader
+                    # was cancelled is still captured
+                    if buffer:
+                        text = buffer.decode("utf-8", errors=decoder_errors)
+                        lines.extend(text.removesuffix("\n").split("\n"))
+                return
+
             while True:
                 # Read available data
-                chunk = await stream.read(1024)
+                chunk = await stream.read(_STREAM_CHUNK_SIZE)
                 if not chunk:
                     break
 
                 buffer += chunk
 
-                # Process complete lines
-                while b"\n" in buffer:
-                    line_bytes, buffer = buffer.split(b"\n", 1)
-                    try:
-                        line = line_bytes.decode("utf-8", errors=decoder_errors)
-                    except Exception:
-                        line = str(line_bytes)
-
-                    lines.append(line)
-                    if self.stream_output:
-                        self._display_line(line, is_stderr)
+                # Process complete lines, keeping any trailing partial line in
+                # the buffer for the next read. All lines completed by this
+                # chunk are displayed with one print, since each Rich print
+                # pays for its own render pass and terminal write.
+                end = buffer.rfind(b"\n")
+                if end == -1:
+                    continue
+                text = buffer[:end].decode("utf-8", errors=decoder_errors)
+                del buffer[: end + 1]
+                lines.extend(text.split("\n"))
+                self._display_line(text, is_stderr)
 
             # Process remaining buffer
             if buffer:
-                try:
-                    line = buffer.decode("utf-8", errors=decoder_errors)
-                except Exception:
-                    line = str(buffer)
+                line = buffer.decode("utf-8", errors=decoder_errors)
                 lines.append(line)
-                if self.stream_output:
-                    self._display_line(line, is_stderr)
+                self._display_line(line, is_stderr)
 
         except Exception as e:
             error_line = f"Stream reading error: {e}"
@@ -323,7 +361,7 @@ class SubprocessExecutor:
         """Display a line of output with appropriate theming.
 
         Args:
-            line: The line to display
+            line: The line to display (may hold several newline-separated lines)
             is_stderr: Whether this is stderr output
         """
         if is_stderr:
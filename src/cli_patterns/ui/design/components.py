@@ -7,6 +7,7 @@ across the CLI interface.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Any, Optional
 
@@ -23,8 +24,16 @@ from .tokens import (
     StatusToken,
 )
 
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+"""dataclass() options giving the token mapping components __slots__.
 
-@dataclass
+The components are built per render (e.g. one Panel per themed panel), so
+dropping the instance __dict__ makes each one smaller.
+dataclass(slots=True) needs Python 3.10+; older versions keep a __dict__.
+"""
+
+
+@dataclass(**_SLOTS)
 class Panel:
     """Token mappings for panel components."""
 
@@ -34,7 +43,7 @@ class Panel:
     content_emphasis: EmphasisToken = EmphasisToken.NORMAL
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProgressBar:
     """Token mappings for progress indicators."""
 
@@ -44,7 +53,7 @@ class ProgressBar:
     bar_category: CategoryToken = CategoryToken.CAT_2
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Prompt:
     """Token mappings for interactive prompts."""
 
@@ -54,7 +63,7 @@ class Prompt:
     error_status: StatusToken = StatusToken.ERROR
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Output:
     """Token mappings for command output."""
 
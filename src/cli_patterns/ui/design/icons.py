@@ -6,6 +6,7 @@ capabilities, with fallback logic for maximum compatibility.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 
@@ -94,24 +95,28 @@ ICON_SETS = {
     "nerd": NERD_FONT_ICONS,
 }
 
+DEFAULT_ICON_PREFERENCE = ("emoji", "unicode", "ascii")
+"""Icon set names tried by get_icon_set() when no preference is given."""
 
-def get_icon_set(preference_order: list[str] | None = None) -> IconSet:
+
+def get_icon_set(preference_order: Sequence[str] | None = None) -> IconSet:
     """Get best available icon set with fallback.
 
     Args:
-        preference_order: List of icon set names in order of preference.
-                         If None, defaults to ["emoji", "unicode", "ascii"].
+        preference_order: Icon set names in order of preference.
+                         If None, defaults to DEFAULT_ICON_PREFERENCE.
 
     Returns:
         The best available icon set, falling back to ASCII_ICONS if
         no preference matches.
     """
     if preference_order is None:
-        preference_order = ["emoji", "unicode", "ascii"]
+        preference_order = DEFAULT_ICON_PREFERENCE
 
     # In real implementation, would check terminal capabilities
     # For now, just return first preference
     for pref in preference_order:
-        if pref in ICON_SETS:
-            return ICON_SETS[pref]
+        icon_set = ICON_SETS.get(pref)
+        if icon_set is not None:
+            return icon_set
     return ASCII_ICONS
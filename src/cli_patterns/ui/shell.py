@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import sys
+from collections.abc import Coroutine
 from typing import Any, Callable, Optional, Union
 
 from prompt_toolkit import PromptSession
@@ -569,11 +570,35 @@ class InteractiveShell:
             self.console.print(f"[status.error]Unexpected Error:[/status.error] {e}")
 
 
+def _run_event_loop(main: Coroutine[Any, Any, None]) -> None:
+    """Run a coroutine to completion, on uvloop when it is installed.
+
+    uvloop is optional (and unavailable on Windows); it speeds up the
+    subprocess and stream handling behind command execution. Without it the
+    standard asyncio event loop is used.
+    """
+    try:
+        import uvloop  # type: ignore[import-not-found,unused-ignore]
+    except ImportError:
+        asyncio.run(main)
+        return
+
+    if sys.version_info >= (3, 11):
+        # Runner accepts any loop factory, so this works with every uvloop
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main)
+    elif hasattr(uvloop, "run"):
+        uvloop.run(main)
+    else:
+        # uvloop.run() only exists in uvloop 0.18+
+        asyncio.run(main)
+
+
 def run_shell() -> None:
     """Synchronous entry point for the interactive shell."""
     shell = InteractiveShell()
     try:
-        asyncio.run(shell.run())
+        _run_event_loop(shell.run())
     except KeyboardInterrupt:
         print("\nShell interrupted")
         sys.exit(0)
@@ -0,0 +1,27 @@
+"""Shared fixtures for core unit tests."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from cli_patterns.core.validators import MAX_COLLECTION_SIZE, MAX_JSON_DEPTH
+
+# Neither the validators nor the models mutate these inputs, so they are built
+# once per session and shared by the validator and model security tests.
+
+
+@pytest.fixture(scope="session")
+def deep_dict_over_limit() -> dict[str, Any]:
+    """Create a dict nested one level past the depth limit."""
+    data: dict[str, Any] = {"value": 1}
+    for _ in range(MAX_JSON_DEPTH + 1):
+        data = {"nested": data}
+    return data
+
+
+@pytest.fixture(scope="session")
+def big_list_over_limit() -> list[int]:
+    """Create a list one item over the collection size limit."""
+    return list(range(MAX_COLLECTION_SIZE + 1))
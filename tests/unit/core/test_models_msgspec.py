@@ -0,0 +1,109 @@
+"""Comparative msgspec mirrors of the action configuration models.
+
+This module mirrors the action models as tagged ``msgspec.Struct`` types and
+runs the same JSON decoding checks as the Pydantic tests. It gives a baseline
+for comparing decode cost before moving hot paths (definition loading,
+session serialization) off Pydantic. msgspec is not a project dependency, so
+these tests are skipped unless it is installed.
+"""
+
+from typing import Any, Optional, Union
+
+import pytest
+from pydantic import TypeAdapter
+
+from cli_patterns.core.models import (
+    ActionConfigUnion,
+    BashActionConfig,
+    PythonActionConfig,
+)
+
+msgspec = pytest.importorskip("msgspec")
+
+pytestmark = pytest.mark.perf
+
+
+class BashActionStruct(msgspec.Struct, tag="bash", tag_field="type", kw_only=True):
+    """msgspec mirror of BashActionConfig."""
+
+    id: str
+    name: str
+    command: str
+    description: Optional[str] = None
+    env: dict[str, str] = msgspec.field(default_factory=dict)
+    allow_shell_features: bool = False
+    metadata: dict[str, Any] = msgspec.field(default_factory=dict)
+    tags: list[str] = msgspec.field(default_factory=list)
+
+
+class PythonActionStruct(msgspec.Struct, tag="python", tag_field="type", kw_only=True):
+    """msgspec mirror of PythonActionConfig."""
+
+    id: str
+    name: str
+    module: str
+    function: str
+    description: Optional[str] = None
+    metadata: dict[str, Any] = msgspec.field(default_factory=dict)
+    tags: list[str] = msgspec.field(default_factory=list)
+
+
+ACTION_DECODER = msgspec.json.Decoder(Union[BashActionStruct, PythonActionStruct])
+"""Decodes raw action JSON through the tagged struct union."""
+
+ACTION_ADAPTER: TypeAdapter[ActionConfigUnion] = TypeAdapter(ActionConfigUnion)
+"""Pydantic counterpart of ACTION_DECODER."""
+
+BASH_ACTION_JSON = (
+    b'{"type": "bash", "id": "deploy", "name": "Deploy", "command": "deploy.sh"}'
+)
+PYTHON_ACTION_JSON = (
+    b'{"type": "python", "id": "process", "name": "Process", '
+    b'"module": "app", "function": "run"}'
+)
+
+
+class TestMsgspecActionMirrors:
+    """Test that the msgspec mirrors decode actions like the Pydantic models."""
+
+    def test_action_discriminated_union(self) -> None:
+        """
+        GIVEN: Raw JSON for different action types
+        WHEN: Decoding through the tagged struct union
+        THEN: msgspec selects the struct based on the 'type' tag
+        """
+        assert isinstance(ACTION_DECODER.decode(BASH_ACTION_JSON), BashActionStruct)
+        assert isinstance(ACTION_DECODER.decode(PYTHON_ACTION_JSON), PythonActionStruct)
+
+    @pytest.mark.parametrize(
+        "raw,model_cls",
+        [
+            (BASH_ACTION_JSON, BashActionConfig),
+            (PYTHON_ACTION_JSON, PythonActionConfig),
+        ],
+        ids=["bash", "python"],
+    )
+    def test_json_deserialization_matches_pydantic(
+        self, raw: bytes, model_cls: type[Any]
+    ) -> None:
+        """
+        GIVEN: Raw action JSON
+        WHEN: Decoding with msgspec and validating with Pydantic
+        THEN: Both produce the same fields, including defaults
+        """
+        struct = ACTION_DECODER.decode(raw)
+        model = ACTION_ADAPTER.validate_json(raw)
+
+        assert isinstance(model, model_cls)
+        assert msgspec.to_builtins(struct) == model.model_dump()
+
+    def test_msgspec_output_validates_with_pydantic(self) -> None:
+        """
+        GIVEN: An action decoded with msgspec
+        WHEN: Re-encoding it and validating through Pydantic
+        THEN: The resulting model equals one validated from the original JSON
+        """
+        encoded = msgspec.json.encode(ACTION_DECODER.decode(BASH_ACTION_JSON))
+        assert ACTION_ADAPTER.validate_json(encoded) == ACTION_ADAPTER.validate_json(
+            BASH_ACTION_JSON
+        )
@@ -7,107 +7,107 @@ type confusion while maintaining MyPy strict mode compliance.
 
 from __future__ import annotations
 
-from typing import Any
+import json
+import re
+from types import SimpleNamespace
+from typing import Any, Callable
 
 import pytest
 
-# Import the types we're testing (these will fail initially)
-try:
-    from cli_patterns.core.parser_types import (
-        ArgumentValue,
-        CommandId,
-        OptionKey,
-        make_argument_value,
-        make_command_id,
-        make_context_key,
-        make_flag_name,
-        make_option_key,
-        make_parse_mode,
+from cli_patterns.core.parser_types import (
+    ArgumentValue,
+    CommandId,
+    OptionKey,
+    make_argument_value,
+    make_command_id,
+    make_context_key,
+    make_flag_name,
+    make_option_key,
+    make_parse_mode,
+)
+
+# Patterns used by the regex compatibility test, compiled once at import
+GIT_SUBCOMMAND_RE = re.compile(r"git-\w+")
+COMMIT_RE = re.compile(r"commit")
+DASH_RE = re.compile(r"-")
+
+SEMANTIC_FACTORIES = (
+    make_command_id,
+    make_option_key,
+    make_flag_name,
+    make_argument_value,
+    make_parse_mode,
+    make_context_key,
+)
+"""Factory for every parser semantic type."""
+
+SEMANTIC_FACTORY_IDS = (
+    "command_id",
+    "option_key",
+    "flag_name",
+    "argument_value",
+    "parse_mode",
+    "context_key",
+)
+"""Test ids matching SEMANTIC_FACTORIES."""
+
+JSON_PAYLOAD = {
+    "command": make_command_id("deploy"),
+    "options": {
+        make_option_key("env"): make_argument_value("prod"),
+        make_option_key("region"): make_argument_value("us-west"),
+    },
+    "flags": [make_flag_name("verbose"), make_flag_name("force")],
+}
+"""Nested structure of semantic types used by the JSON serialization test."""
+
+EXPECTED_JSON_VALUES = ("deploy", "prod")
+"""Values that must appear in the serialized semantic type payload."""
+
+
+@pytest.fixture(scope="module")
+def semantic() -> SimpleNamespace:
+    """Semantic values shared by tests in this module, built once."""
+    return SimpleNamespace(
+        help=make_command_id("help"),
+        status=make_command_id("status"),
+        deploy=make_command_id("deploy"),
+        env=make_option_key("env"),
+        region=make_option_key("region"),
     )
-except ImportError:
-    # These imports will fail initially since the implementation doesn't exist
-    pass
-
-pytestmark = pytest.mark.unit
 
 
 class TestSemanticTypeDefinitions:
     """Test basic semantic type creation and identity."""
 
-    def test_command_id_creation(self) -> None:
+    @pytest.mark.parametrize(
+        "factory,value",
+        [
+            (make_command_id, "help"),
+            (make_option_key, "output"),
+            (make_flag_name, "verbose"),
+            (make_argument_value, "file.txt"),
+            (make_parse_mode, "interactive"),
+            (make_context_key, "user_role"),
+        ],
+        ids=SEMANTIC_FACTORY_IDS,
+    )
+    def test_semantic_type_creation(
+        self, factory: Callable[[str], str], value: str
+    ) -> None:
         """
-        GIVEN: A string value for a command
-        WHEN: Creating a CommandId
-        THEN: The CommandId maintains the value but has distinct type identity
+        GIVEN: A string value for a semantic type
+        WHEN: Creating the semantic type with its factory
+        THEN: The value is preserved and is a str at runtime
         """
-        cmd_str = "help"
-        cmd_id = make_command_id(cmd_str)
+        semantic_value = factory(value)
 
         # Value preservation
-        assert str(cmd_id) == cmd_str
-
-        # Type identity (will be checked by MyPy at compile time)
-        assert isinstance(cmd_id, str)  # Runtime check
-
-    def test_option_key_creation(self) -> None:
-        """
-        GIVEN: A string value for an option key
-        WHEN: Creating an OptionKey
-        THEN: The OptionKey maintains the value but has distinct type identity
-        """
-        key_str = "output"
-        option_key = make_option_key(key_str)
-
-        assert str(option_key) == key_str
-        assert isinstance(option_key, str)
+        assert str(semantic_value) == value
 
-    def test_flag_name_creation(self) -> None:
-        """
-        GIVEN: A string value for a flag name
-        WHEN: Creating a FlagName
-        THEN: The FlagName maintains the value but has distinct type identity
-        """
-        flag_str = "verbose"
-        flag_name = make_flag_name(flag_str)
-
-        assert str(flag_name) == flag_str
-        assert isinstance(flag_name, str)
-
-    def test_argument_value_creation(self) -> None:
-        """
-        GIVEN: A string value for an argument
-        WHEN: Creating an ArgumentValue
-        THEN: The ArgumentValue maintains the value but has distinct type identity
-        """
-        arg_str = "file.txt"
-        arg_value = make_argument_value(arg_str)
-
-        assert str(arg_value) == arg_str
-        assert isinstance(arg_value, str)
-
-    def test_parse_mode_creation(self) -> None:
-        """
-        GIVEN: A string value for a parse mode
-        WHEN: Creating a ParseMode
-        THEN: The ParseMode maintains the value but has distinct type identity
-        """
-        mode_str = "interactive"
-        parse_mode = make_parse_mode(mode_str)
-
-        assert str(parse_mode) == mode_str
-        assert isinstance(parse_mode, str)
-
-    def test_context_key_creation(self) -> None:
-        """
-        GIVEN: A string value for a context key
-        WHEN: Creating a ContextKey
-        THEN: The ContextKey maintains the value but has distinct type identity
-        """
-        key_str = "user_role"
-        context_key = make_context_key(key_str)
-
-        assert str(context_key) == key_str
-        assert isinstance(context_key, str)
+        # Type identity is checked by MyPy; at runtime this is the single
+        # place the suite confirms each semantic type is a plain str.
+        assert isinstance(semantic_value, str)
 
 
 class TestSemanticTypeDistinctness:
@@ -128,44 +128,39 @@ class TestSemanticTypeDistinctness:
         parse_mode = make_parse_mode(base_str)
         context_key = make_context_key(base_str)
 
-        # All are strings at runtime
-        for semantic_type in [
+        # All wrap the same string value
+        for semantic_type in (
             cmd_id,
             option_key,
             flag_name,
             arg_value,
             parse_mode,
             context_key,
-        ]:
-            assert isinstance(semantic_type, str)
+        ):
             assert str(semantic_type) == base_str
 
-    def test_type_safety_in_collections(self) -> None:
+    def test_type_safety_in_collections(self, semantic: SimpleNamespace) -> None:
         """
         GIVEN: Semantic types used in collections
         WHEN: Adding them to typed collections
         THEN: The types maintain their semantic meaning in collections
         """
         # Test CommandId in sets and lists
-        cmd1 = make_command_id("help")
-        cmd2 = make_command_id("status")
+        cmd1 = semantic.help
+        cmd2 = semantic.status
         cmd3 = make_command_id("help")  # Duplicate value
 
-        command_set: set[CommandId] = {cmd1, cmd2, cmd3}
-        assert len(command_set) == 2  # Duplicate removed
-
-        command_list: list[CommandId] = [cmd1, cmd2, cmd3]
-        assert len(command_list) == 3  # Duplicates preserved
+        assert len({cmd1, cmd2, cmd3}) == 2  # Duplicate removed
+        assert len([cmd1, cmd2, cmd3]) == 3  # Duplicates preserved
 
         # Test OptionKey in dictionaries
         key1 = make_option_key("output")
         key2 = make_option_key("format")
 
-        options_dict: dict[OptionKey, ArgumentValue] = {
+        assert {
             key1: make_argument_value("file.txt"),
             key2: make_argument_value("json"),
-        }
-        assert len(options_dict) == 2
+        } == {"output": "file.txt", "format": "json"}
 
     def test_string_operations_work(self) -> None:
         """
@@ -175,51 +170,65 @@ class TestSemanticTypeDistinctness:
         """
         cmd_id = make_command_id("help-command")
 
-        # String methods work
-        assert cmd_id.upper() == "HELP-COMMAND"
-        assert cmd_id.lower() == "help-command"
-        assert cmd_id.replace("-", "_") == "help_command"
-        assert cmd_id.startswith("help")
-        assert cmd_id.endswith("command")
-        assert len(cmd_id) == 12
-        assert "help" in cmd_id
-
-        # String concatenation works
-        combined = cmd_id + "_suffix"
-        assert combined == "help-command_suffix"
-
-        # String formatting works
-        formatted = f"Command: {cmd_id}"
-        assert formatted == "Command: help-command"
+        # String methods, concatenation and formatting all work; comparing
+        # one tuple keeps pytest's diff readable if any of them regresses.
+        assert (
+            cmd_id.upper(),
+            cmd_id.lower(),
+            cmd_id.replace("-", "_"),
+            cmd_id.startswith("help"),
+            cmd_id.endswith("command"),
+            len(cmd_id),
+            "help" in cmd_id,
+            cmd_id + "_suffix",
+            f"Command: {cmd_id}",
+        ) == (
+            "HELP-COMMAND",
+            "help-command",
+            "help_command",
+            True,
+            True,
+            12,
+            True,
+            "help-command_suffix",
+            "Command: help-command",
+        )
 
 
 class TestSemanticTypeValidation:
     """Test validation and error handling for semantic types."""
 
-    def test_empty_string_handling(self) -> None:
+    @pytest.mark.parametrize(
+        "factory",
+        SEMANTIC_FACTORIES,
+        ids=SEMANTIC_FACTORY_IDS,
+    )
+    def test_empty_string_handling(self, factory: Callable[[str], str]) -> None:
         """
         GIVEN: Empty string values
         WHEN: Creating semantic types
         THEN: Empty strings are handled appropriately
         """
-        empty_cmd = make_command_id("")
-        empty_option = make_option_key("")
-        empty_flag = make_flag_name("")
-        empty_arg = make_argument_value("")
-        empty_mode = make_parse_mode("")
-        empty_key = make_context_key("")
-
-        # All should be empty strings
-        for semantic_type in [
-            empty_cmd,
-            empty_option,
-            empty_flag,
-            empty_arg,
-            empty_mode,
-            empty_key,
-        ]:
-            assert str(semantic_type) == ""
-            assert len(semantic_type) == 0
+        empty_value = factory("")
+
+        assert str(empty_value) == ""
+        assert len(empty_value) == 0
+
+    @pytest.mark.parametrize(
+        "factory",
+        SEMANTIC_FACTORIES,
+        ids=SEMANTIC_FACTORY_IDS,
+    )
+    @pytest.mark.parametrize("value", [None, 123], ids=["none", "int"])
+    def test_factory_passes_value_through(
+        self, factory: Callable[..., Any], value: Any
+    ) -> None:
+        """
+        GIVEN: A value that is not a string
+        WHEN: Creating a semantic type without validation
+        THEN: The value is returned unchanged rather than converted to str
+        """
+        assert factory(value) is value
 
     def test_whitespace_handling(self) -> None:
         """
@@ -251,65 +260,38 @@ class TestSemanticTypeValidation:
 class TestSemanticTypeEquality:
     """Test equality and hashing behavior of semantic types."""
 
-    def test_equality_with_same_type(self) -> None:
-        """
-        GIVEN: Two semantic types of the same type with same value
-        WHEN: Comparing for equality
-        THEN: They are equal
-        """
-        cmd1 = make_command_id("help")
-        cmd2 = make_command_id("help")
-
-        assert cmd1 == cmd2
-        assert not (cmd1 != cmd2)
-
-    def test_equality_with_different_values(self) -> None:
-        """
-        GIVEN: Two semantic types of the same type with different values
-        WHEN: Comparing for equality
-        THEN: They are not equal
-        """
-        cmd1 = make_command_id("help")
-        cmd2 = make_command_id("status")
-
-        assert cmd1 != cmd2
-        assert not (cmd1 == cmd2)
-
-    def test_equality_with_raw_string(self) -> None:
+    @pytest.mark.parametrize(
+        "left,right,equal",
+        [("help", "help", True), ("help", "status", False)],
+        ids=["same_value", "different_values"],
+    )
+    def test_equality_and_hashing(self, left: str, right: str, equal: bool) -> None:
         """
-        GIVEN: A semantic type and a raw string with the same value
-        WHEN: Comparing for equality
-        THEN: They are equal (since semantic types are NewType)
+        GIVEN: Two semantic types built from the same or different values
+        WHEN: Comparing them, comparing with raw strings, and using them as keys
+        THEN: They follow str equality and hashing semantics
         """
-        cmd_id = make_command_id("help")
-        raw_str = "help"
+        cmd1 = make_command_id(left)
+        cmd2 = make_command_id(right)
 
-        assert cmd_id == raw_str
-        assert raw_str == cmd_id
-
-    def test_hashing_behavior(self) -> None:
-        """
-        GIVEN: Semantic types with same and different values
-        WHEN: Using them as dictionary keys or in sets
-        THEN: Hashing works correctly
-        """
-        cmd1 = make_command_id("help")
-        cmd2 = make_command_id("help")
-        cmd3 = make_command_id("status")
+        # Equality with the same semantic type
+        assert (cmd1 == cmd2) is equal
+        assert (cmd1 != cmd2) is not equal
 
-        # Same value should have same hash
-        assert hash(cmd1) == hash(cmd2)
+        # Equality with the raw string (semantic types are plain str)
+        assert cmd1 == left
+        assert left == cmd1
 
-        # Can be used as dict keys
-        cmd_dict = {cmd1: "help_info", cmd3: "status_info"}
-        assert len(cmd_dict) == 2
-        assert cmd_dict[cmd2] == "help_info"  # cmd2 should work as key
+        # Hashing and dict key lookup
+        if equal:
+            assert hash(cmd1) == hash(cmd2)
+        assert ({cmd1: "info"}.get(cmd2) == "info") is equal
 
 
 class TestSemanticTypeUsagePatterns:
     """Test common usage patterns and best practices."""
 
-    def test_function_signature_type_safety(self) -> None:
+    def test_function_signature_type_safety(self, semantic: SimpleNamespace) -> None:
         """
         GIVEN: Functions that expect specific semantic types
         WHEN: Calling them with correct types
@@ -321,15 +303,13 @@ class TestSemanticTypeUsagePatterns:
         ) -> str:
             return f"Processing {cmd} with {len(options)} options"
 
-        cmd = make_command_id("deploy")
         opts = {
-            make_option_key("env"): make_argument_value("production"),
-            make_option_key("region"): make_argument_value("us-west-2"),
+            semantic.env: make_argument_value("production"),
+            semantic.region: make_argument_value("us-west-2"),
         }
 
-        result = process_command(cmd, opts)
-        assert "deploy" in result
-        assert "2 options" in result
+        result = process_command(semantic.deploy, opts)
+        assert result == "Processing deploy with 2 options"
 
     def test_type_conversion_patterns(self) -> None:
         """
@@ -338,7 +318,7 @@ class TestSemanticTypeUsagePatterns:
         THEN: The conversion preserves value but adds type safety
         """
         raw_commands = ["help", "status", "deploy"]
-        semantic_commands = [make_command_id(cmd) for cmd in raw_commands]
+        semantic_commands = list(map(make_command_id, raw_commands))
 
         assert len(semantic_commands) == 3
         for raw, semantic in zip(raw_commands, semantic_commands):
@@ -359,10 +339,7 @@ class TestSemanticTypeUsagePatterns:
         }
 
         assert len(parser_data) == 4
-
-        # All keys are strings at runtime but have semantic meaning
-        for key in parser_data.keys():
-            assert isinstance(key, str)
+        assert set(parser_data) == {"git", "branch", "verbose", "session_id"}
 
 
 class TestSemanticTypeCompatibility:
@@ -374,21 +351,9 @@ class TestSemanticTypeCompatibility:
         WHEN: Serializing to JSON
         THEN: Serialization works normally
         """
-        import json
-
-        data = {
-            "command": make_command_id("deploy"),
-            "options": {
-                make_option_key("env"): make_argument_value("prod"),
-                make_option_key("region"): make_argument_value("us-west"),
-            },
-            "flags": [make_flag_name("verbose"), make_flag_name("force")],
-        }
-
-        # Should serialize without errors
-        json_str = json.dumps(data, default=str)
-        assert "deploy" in json_str
-        assert "prod" in json_str
+        # Semantic types are plain str, so no default= fallback is needed
+        json_str = json.dumps(JSON_PAYLOAD)
+        assert all(value in json_str for value in EXPECTED_JSON_VALUES)
 
     def test_string_formatting_compatibility(self) -> None:
         """
@@ -400,17 +365,17 @@ class TestSemanticTypeCompatibility:
         option = make_option_key("branch")
         value = make_argument_value("main")
 
-        # Format strings
-        formatted1 = f"Command: {cmd}, Option: {option}={value}"
-        assert formatted1 == "Command: git, Option: branch=main"
+        expected = "Command: git, Option: branch=main"
 
-        # str.format()
-        formatted2 = f"Command: {cmd}, Option: {option}={value}"
-        assert formatted2 == "Command: git, Option: branch=main"
+        # Format strings
+        assert f"Command: {cmd}, Option: {option}={value}" == expected
 
-        # % formatting
-        formatted3 = f"Command: {cmd}, Option: {option}={value}"
-        assert formatted3 == "Command: git, Option: branch=main"
+        # str.format() and % formatting (kept out of pyupgrade's f-string fix)
+        template = "Command: {}, Option: {}={}"
+        formatted = template.format(cmd, option, value)
+        assert formatted == expected
+        formatted = "Command: %s, Option: %s=%s" % (cmd, option, value)  # noqa: UP031
+        assert formatted == expected
 
     def test_regex_compatibility(self) -> None:
         """
@@ -418,19 +383,17 @@ class TestSemanticTypeCompatibility:
         WHEN: Performing regex matching
         THEN: Regex operations work normally
         """
-        import re
-
         cmd = make_command_id("git-commit")
         option = make_option_key("output-file")
 
         # Pattern matching
-        assert re.match(r"git-\w+", cmd)
-        assert re.search(r"commit", cmd)
+        assert GIT_SUBCOMMAND_RE.match(cmd)
+        assert COMMIT_RE.search(cmd)
 
         # Substitution
-        new_cmd = re.sub(r"-", "_", cmd)
+        new_cmd = DASH_RE.sub("_", cmd)
         assert new_cmd == "git_commit"
 
         # Split
-        parts = re.split(r"-", option)
+        parts = DASH_RE.split(option)
         assert parts == ["output", "file"]
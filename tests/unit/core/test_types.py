@@ -7,86 +7,68 @@ type confusion while maintaining MyPy strict mode compliance.
 
 from __future__ import annotations
 
-from typing import Any
+import json
+from typing import Any, Callable
 
 import pytest
 
-# Import the types we're testing (these will fail initially)
-try:
-    from cli_patterns.core.types import (
-        ActionId,
-        BranchId,
-        OptionKey,
-        StateValue,
-        is_action_id,
-        is_branch_id,
-        is_menu_id,
-        is_option_key,
-        make_action_id,
-        make_branch_id,
-        make_menu_id,
-        make_option_key,
-    )
-except ImportError:
-    # These imports will fail initially since the implementation doesn't exist
-    pass
+from cli_patterns.core.types import (
+    ActionId,
+    BranchId,
+    OptionKey,
+    StateValue,
+    is_action_id,
+    is_branch_id,
+    is_menu_id,
+    is_option_key,
+    make_action_id,
+    make_branch_id,
+    make_menu_id,
+    make_option_key,
+)
 
 pytestmark = pytest.mark.unit
 
+FACTORIES_WITH_NAMES = [
+    (make_branch_id, "BranchId"),
+    (make_action_id, "ActionId"),
+    (make_option_key, "OptionKey"),
+    (make_menu_id, "MenuId"),
+]
+"""Every semantic type factory with the type name used in its errors."""
+
+FACTORY_IDS = ["branch_id", "action_id", "option_key", "menu_id"]
+"""Test ids matching FACTORIES_WITH_NAMES."""
+
 
 class TestSemanticTypeDefinitions:
     """Test basic semantic type creation and identity."""
 
-    def test_branch_id_creation(self) -> None:
+    @pytest.mark.parametrize(
+        "factory,value",
+        [
+            (make_branch_id, "main_menu"),
+            (make_action_id, "deploy_app"),
+            (make_option_key, "environment"),
+            (make_menu_id, "settings_menu"),
+        ],
+        ids=FACTORY_IDS,
+    )
+    def test_semantic_type_creation(
+        self, factory: Callable[[str], str], value: str
+    ) -> None:
         """
-        GIVEN: A string value for a branch
-        WHEN: Creating a BranchId
-        THEN: The BranchId maintains the value but has distinct type identity
+        GIVEN: A string value for a semantic type
+        WHEN: Creating the semantic type with its factory
+        THEN: The value is preserved but has distinct type identity
         """
-        branch_str = "main_menu"
-        branch_id = make_branch_id(branch_str)
+        semantic_value = factory(value)
 
         # Value preservation
-        assert str(branch_id) == branch_str
+        assert str(semantic_value) == value
 
         # Type identity (will be checked by MyPy at compile time)
-        assert isinstance(branch_id, str)  # Runtime check
-
-    def test_action_id_creation(self) -> None:
-        """
-        GIVEN: A string value for an action
-        WHEN: Creating an ActionId
-        THEN: The ActionId maintains the value but has distinct type identity
-        """
-        action_str = "deploy_app"
-        action_id = make_action_id(action_str)
-
-        assert str(action_id) == action_str
-        assert isinstance(action_id, str)
-
-    def test_option_key_creation(self) -> None:
-        """
-        GIVEN: A string value for an option key
-        WHEN: Creating an OptionKey
-        THEN: The OptionKey maintains the value but has distinct type identity
-        """
-        key_str = "environment"
-        option_key = make_option_key(key_str)
-
-        assert str(option_key) == key_str
-        assert isinstance(option_key, str)
-
-    def test_menu_id_creation(self) -> None:
-        """
-        GIVEN: A string value for a menu
-        WHEN: Creating a MenuId
-        THEN: The MenuId maintains the value but has distinct type identity
-        """
-        menu_str = "settings_menu"
-        menu_id = make_menu_id(menu_str)
-
-        assert str(menu_id) == menu_str
-        assert isinstance(menu_id, str)
+        assert isinstance(semantic_value, str)  # Runtime check
 
 
 class TestSemanticTypeDistinctness:
@@ -106,9 +88,10 @@ class TestSemanticTypeDistinctness:
         menu_id = make_menu_id(base_str)
 
         # All are strings at runtime
-        for semantic_type in [branch_id, action_id, option_key, menu_id]:
-            assert isinstance(semantic_type, str)
-            assert str(semantic_type) == base_str
+        assert all(
+            isinstance(semantic_type, str) and semantic_type == base_str
+            for semantic_type in (branch_id, action_id, option_key, menu_id)
+        )
 
     def test_type_safety_in_collections(self) -> None:
         """
@@ -179,59 +162,56 @@ class TestSemanticTypeValidation:
         empty_menu = make_menu_id("")
 
         # All should be empty strings
-        for semantic_type in [empty_branch, empty_action, empty_option, empty_menu]:
-            assert str(semantic_type) == ""
-            assert len(semantic_type) == 0
-
-    def test_factory_with_validation_rejects_empty(self) -> None:
-        """
-        GIVEN: Factory functions called with validation enabled
-        WHEN: Creating semantic types with empty strings
-        THEN: ValueError is raised
-        """
-        with pytest.raises(ValueError, match="BranchId cannot be empty"):
-            make_branch_id("", validate=True)
-
-        with pytest.raises(ValueError, match="ActionId cannot be empty"):
-            make_action_id("", validate=True)
-
-        with pytest.raises(ValueError, match="OptionKey cannot be empty"):
-            make_option_key("", validate=True)
-
-        with pytest.raises(ValueError, match="MenuId cannot be empty"):
-            make_menu_id("", validate=True)
-
-    def test_factory_with_validation_rejects_whitespace_only(self) -> None:
+        assert all(
+            semantic_type == ""
+            for semantic_type in (empty_branch, empty_action, empty_option, empty_menu)
+        )
+
+    @pytest.mark.parametrize(
+        "factory,type_name",
+        FACTORIES_WITH_NAMES,
+        ids=FACTORY_IDS,
+    )
+    @pytest.mark.parametrize(
+        "value,message",
+        [
+            ("", "cannot be empty"),
+            ("   ", "cannot be empty"),
+            ("\t\n", "cannot be empty"),
+            ("x" * 101, "is too long"),
+        ],
+        ids=["empty", "spaces", "tab_newline", "too_long"],
+    )
+    def test_factory_with_validation_rejects_invalid(
+        self,
+        factory: Callable[..., str],
+        type_name: str,
+        value: str,
+        message: str,
+    ) -> None:
         """
         GIVEN: Factory functions called with validation enabled
-        WHEN: Creating semantic types with whitespace-only strings
-        THEN: ValueError is raised
+        WHEN: Creating semantic types from empty, blank or too long strings
+        THEN: ValueError naming the semantic type is raised
         """
-        with pytest.raises(ValueError, match="BranchId cannot be empty"):
-            make_branch_id("   ", validate=True)
-
-        with pytest.raises(ValueError, match="ActionId cannot be empty"):
-            make_action_id("\t\n", validate=True)
+        with pytest.raises(ValueError, match=f"{type_name} {message}"):
+            factory(value, validate=True)
 
-    def test_factory_with_validation_rejects_too_long(self) -> None:
+    @pytest.mark.parametrize(
+        "factory",
+        [make_branch_id, make_action_id, make_option_key, make_menu_id],
+        ids=FACTORY_IDS,
+    )
+    @pytest.mark.parametrize("value", [None, 123], ids=["none", "int"])
+    def test_factory_without_validation_passes_value_through(
+        self, factory: Callable[..., Any], value: Any
+    ) -> None:
         """
-        GIVEN: Factory functions called with validation enabled
-        WHEN: Creating semantic types with strings that are too long
-        THEN: ValueError is raised
+        GIVEN: Factory functions called with validation disabled
+        WHEN: Passing a value that is not a string
+        THEN: The value is returned unchanged rather than converted to str
         """
-        too_long = "x" * 101
-
-        with pytest.raises(ValueError, match="BranchId is too long"):
-            make_branch_id(too_long, validate=True)
-
-        with pytest.raises(ValueError, match="ActionId is too long"):
-            make_action_id(too_long, validate=True)
-
-        with pytest.raises(ValueError, match="OptionKey is too long"):
-            make_option_key(too_long, validate=True)
-
-        with pytest.raises(ValueError, match="MenuId is too long"):
-            make_menu_id(too_long, validate=True)
+        assert factory(value, validate=False) is value
 
     def test_factory_with_validation_accepts_valid_strings(self) -> None:
         """
@@ -325,52 +305,45 @@ class TestSemanticTypeEquality:
 class TestTypeGuards:
     """Test type guard functions for runtime type checking."""
 
-    def test_is_branch_id(self) -> None:
-        """
-        GIVEN: Various values including BranchId
-        WHEN: Checking with is_branch_id type guard
-        THEN: Returns True for strings, False otherwise
-        """
-        branch = make_branch_id("main")
-        assert is_branch_id(branch)
-        assert is_branch_id("main")
-        assert not is_branch_id(123)
-        assert not is_branch_id(None)
-        assert not is_branch_id([])
-
-    def test_is_action_id(self) -> None:
-        """
-        GIVEN: Various values including ActionId
-        WHEN: Checking with is_action_id type guard
-        THEN: Returns True for strings, False otherwise
-        """
-        action = make_action_id("deploy")
-        assert is_action_id(action)
-        assert is_action_id("deploy")
-        assert not is_action_id(123)
-        assert not is_action_id(None)
-
-    def test_is_option_key(self) -> None:
+    @pytest.mark.parametrize(
+        "factory,guard",
+        [
+            (make_branch_id, is_branch_id),
+            (make_action_id, is_action_id),
+            (make_option_key, is_option_key),
+            (make_menu_id, is_menu_id),
+        ],
+        ids=FACTORY_IDS,
+    )
+    def test_type_guard(
+        self, factory: Callable[[str], str], guard: Callable[[Any], bool]
+    ) -> None:
         """
-        GIVEN: Various values including OptionKey
-        WHEN: Checking with is_option_key type guard
+        GIVEN: Various values including a semantic type
+        WHEN: Checking with the matching type guard
         THEN: Returns True for strings, False otherwise
         """
-        option = make_option_key("environment")
-        assert is_option_key(option)
-        assert is_option_key("environment")
-        assert not is_option_key(123)
+        assert guard(factory("main"))
+        assert guard("main")
+        assert not guard(123)
+        assert not guard(None)
+        assert not guard([])
 
-    def test_is_menu_id(self) -> None:
+    @pytest.mark.parametrize(
+        "guard",
+        [is_branch_id, is_action_id, is_option_key, is_menu_id],
+        ids=FACTORY_IDS,
+    )
+    def test_type_guard_is_documented_function(
+        self, guard: Callable[..., bool]
+    ) -> None:
         """
-        GIVEN: Various values including MenuId
-        WHEN: Checking with is_menu_id type guard
-        THEN: Returns True for strings, False otherwise
+        GIVEN: A public type guard
+        WHEN: Calling it by keyword and inspecting it
+        THEN: It behaves as a documented Python function
         """
-        menu = make_menu_id("settings")
-        assert is_menu_id(menu)
-        assert is_menu_id("settings")
-        assert not is_menu_id(123)
+        assert guard(value="main")
+        assert guard.__doc__
 
 
 class TestSemanticTypeUsagePatterns:
@@ -441,8 +414,6 @@ class TestStateValueType:
         WHEN: Using them as StateValue
         THEN: They are accepted by the type system
         """
-        import json
-
         # All these should be valid StateValue types
         state_values: list[StateValue] = [
             "string_value",
@@ -455,10 +426,10 @@ class TestStateValueType:
             {"key": "value", "nested": {"data": 123}},
         ]
 
-        # Should be JSON-serializable
+        # Should be JSON-serializable; one encoder is reused for every value
+        encode = json.JSONEncoder().encode
         for value in state_values:
-            json_str = json.dumps(value)
-            assert json_str is not None
+            assert encode(value) is not None
 
     def test_state_value_in_collections(self) -> None:
         """
@@ -488,8 +459,6 @@ class TestSemanticTypeCompatibility:
         WHEN: Serializing to JSON
         THEN: Serialization works normally
         """
-        import json
-
         data = {
             "branch": make_branch_id("main"),
             "action": make_action_id("deploy"),
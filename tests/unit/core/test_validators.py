@@ -6,6 +6,9 @@ and ensure data integrity.
 
 from __future__ import annotations
 
+import re
+from typing import Any
+
 import pytest
 
 from cli_patterns.core.validators import (
@@ -19,6 +22,20 @@ from cli_patterns.core.validators import (
 
 pytestmark = pytest.mark.unit
 
+# Error patterns used by the pytest.raises checks, compiled once at import
+TOO_DEEP_RE = re.compile("nesting too deep")
+TOO_LARGE_RE = re.compile("too large")
+
+
+# Validators never mutate their input, so oversized inputs are built once and
+# shared; the deep dict and big list come from the core conftest.
+
+
+@pytest.fixture(scope="module")
+def big_dict() -> dict[str, int]:
+    """Create a dict one item over the collection size limit."""
+    return {f"key{i}": i for i in range(MAX_COLLECTION_SIZE + 1)}
+
 
 class TestDepthValidation:
     """Test JSON depth validation."""
@@ -49,24 +66,23 @@ class TestDepthValidation:
         validate_json_depth(True)
         validate_json_depth(None)
 
-    def test_rejects_deeply_nested_dict(self) -> None:
-        """Should reject dict exceeding depth limit."""
-        # Create deeply nested dict
-        data: dict[str, any] = {"value": 1}
-        for _ in range(MAX_JSON_DEPTH + 1):
-            data = {"nested": data}
-
-        with pytest.raises(ValidationError, match="nesting too deep"):
-            validate_json_depth(data)
-
-    def test_rejects_deeply_nested_list(self) -> None:
-        """Should reject list exceeding depth limit."""
-        data: list[any] = [1]
-        for _ in range(MAX_JSON_DEPTH + 1):
-            data = [data]
-
-        with pytest.raises(ValidationError, match="nesting too deep"):
-            validate_json_depth(data)
+    @pytest.mark.parametrize("container", ["dict", "list"])
+    @pytest.mark.parametrize(
+        "delta,ok",
+        [(-1, True), (0, True), (1, False)],
+        ids=["below_limit", "at_limit", "over_limit"],
+    )
+    def test_depth_boundary(self, container: str, delta: int, ok: bool) -> None:
+        """Should accept nesting up to the depth limit and reject one level more."""
+        data: Any = 1
+        for _ in range(MAX_JSON_DEPTH + delta):
+            data = {"nested": data} if container == "dict" else [data]
+
+        if ok:
+            validate_json_depth(data)  # Should not raise
+        else:
+            with pytest.raises(ValidationError, match=TOO_DEEP_RE):
+                validate_json_depth(data)
 
     def test_rejects_mixed_nested_structure(self) -> None:
         """Should reject mixed dict/list exceeding depth."""
@@ -74,7 +90,7 @@ class TestDepthValidation:
         for _ in range(MAX_JSON_DEPTH):
             data = [data]
 
-        with pytest.raises(ValidationError, match="nesting too deep"):
+        with pytest.raises(ValidationError, match=TOO_DEEP_RE):
             validate_json_depth(data)
 
     def test_custom_depth_limit(self) -> None:
@@ -124,19 +140,15 @@ class TestSizeValidation:
         validate_collection_size(True)
         validate_collection_size(None)
 
-    def test_rejects_large_dict(self) -> None:
+    def test_rejects_large_dict(self, big_dict: dict[str, int]) -> None:
         """Should reject dict exceeding size limit."""
-        data = {f"key{i}": i for i in range(MAX_COLLECTION_SIZE + 1)}
-
-        with pytest.raises(ValidationError, match="too large"):
-            validate_collection_size(data)
+        with pytest.raises(ValidationError, match=TOO_LARGE_RE):
+            validate_collection_size(big_dict)
 
-    def test_rejects_large_list(self) -> None:
+    def test_rejects_large_list(self, big_list_over_limit: list[int]) -> None:
         """Should reject list exceeding size limit."""
-        data = list(range(MAX_COLLECTION_SIZE + 1))
-
-        with pytest.raises(ValidationError, match="too large"):
-            validate_collection_size(data)
+        with pytest.raises(ValidationError, match=TOO_LARGE_RE):
+            validate_collection_size(big_list_over_limit)
 
     def test_counts_nested_elements(self) -> None:
         """Should count elements in nested structures."""
@@ -144,7 +156,7 @@ class TestSizeValidation:
         data = {f"key{i}": list(range(100)) for i in range(20)}
         # Total: 20 keys + 20*100 list items = 2020 elements
 
-        with pytest.raises(ValidationError, match="too large"):
+        with pytest.raises(ValidationError, match=TOO_LARGE_RE):
             validate_collection_size(data, max_size=1000)
 
     def test_counts_deeply_nested(self) -> None:
@@ -175,21 +187,30 @@ class TestStateValueValidation:
         data = {"user": {"name": "test", "age": 30, "tags": ["admin", "user"]}}
         validate_state_value(data)
 
-    def test_rejects_too_deep(self) -> None:
+    def test_rejects_too_deep(self, deep_dict_over_limit: dict[str, Any]) -> None:
         """Should reject value that's too deep."""
-        data: dict[str, any] = {"value": 1}
-        for _ in range(MAX_JSON_DEPTH + 1):
-            data = {"nested": data}
+        with pytest.raises(ValidationError, match=TOO_DEEP_RE):
+            validate_state_value(deep_dict_over_limit)
 
-        with pytest.raises(ValidationError, match="nesting too deep"):
-            validate_state_value(data)
-
-    def test_rejects_too_large(self) -> None:
+    def test_rejects_too_large(self, big_list_over_limit: list[int]) -> None:
         """Should reject value that's too large."""
-        data = list(range(MAX_COLLECTION_SIZE + 1))
+        with pytest.raises(ValidationError, match=TOO_LARGE_RE):
+            validate_state_value(big_list_over_limit)
+
+    def test_walks_structure_once(self) -> None:
+        """Should check depth and size in a single pass over the value."""
+
+        class CountingDict(dict[str, Any]):
+            visits = 0
 
-        with pytest.raises(ValidationError, match="too large"):
-            validate_state_value(data)
+            def values(self) -> Any:
+                CountingDict.visits += 1
+                return super().values()
+
+        data = CountingDict(a=CountingDict(b=[1, 2]), c=CountingDict(d=3))
+        validate_state_value(data)
+
+        assert CountingDict.visits == 3  # Once per dict, not once per check
 
     def test_validates_complex_structures(self) -> None:
         """Should validate complex real-world structures."""
@@ -208,13 +229,6 @@ class TestStateValueValidation:
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    def test_exactly_at_depth_limit(self) -> None:
-        """Should accept structure exactly at depth limit."""
-        data: any = 1
-        for _ in range(MAX_JSON_DEPTH):
-            data = {"nested": data}
-        validate_json_depth(data)  # Should pass
-
     def test_exactly_at_size_limit(self) -> None:
         """Should accept collection exactly at size limit."""
         data = list(range(MAX_COLLECTION_SIZE))
@@ -3,16 +3,43 @@
 from __future__ import annotations
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
-from rich.console import Console
 
 from cli_patterns.execution.subprocess_executor import CommandResult, SubprocessExecutor
 
 pytestmark = pytest.mark.executor
 
 
+class _StubConsole:
+    """Console stand-in exposing only the print() the executor calls.
+
+    Cheaper than Mock(spec=Console), which introspects Rich's whole Console
+    API every time a test builds one.
+    """
+
+    def __init__(self) -> None:
+        self.print = Mock()
+
+
+def _mock_process(
+    returncode: int | None = 0,
+    stdout: tuple[bytes, ...] = (),
+    stderr: tuple[bytes, ...] = (),
+) -> AsyncMock:
+    """Build a mock process whose pipes yield the given chunks, then EOF."""
+    process = AsyncMock()
+    process.returncode = returncode
+    process.stdout = AsyncMock()
+    process.stderr = AsyncMock()
+    process.stdout.read.side_effect = [*stdout, b""]
+    process.stderr.read.side_effect = [*stderr, b""]
+    process.wait.return_value = None
+    process.kill = MagicMock()
+    return process
+
+
 class TestCommandResult:
     """Test CommandResult class."""
 
@@ -53,239 +80,293 @@ class TestCommandResult:
         assert not result.success
         assert result.interrupted
 
+    def test_result_uses_slots(self):
+        """Test results carry no per-instance __dict__."""
+        result = CommandResult(exit_code=0, stdout="", stderr="")
+        assert not hasattr(result, "__dict__")
+
 
 class TestSubprocessExecutor:
     """Test SubprocessExecutor class."""
 
     @pytest.fixture
     def console(self):
-        """Mock Rich console."""
-        return Mock(spec=Console)
+        """Stub Rich console with a mocked print()."""
+        return _StubConsole()
 
     @pytest.fixture
     def executor(self, console):
         """Create executor with mocked console."""
         return SubprocessExecutor(console=console, default_timeout=10.0)
 
+    @pytest.fixture
+    def mock_create(self, monkeypatch):
+        """Replace asyncio.create_subprocess_exec for the duration of a test."""
+        mock = AsyncMock()
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", mock)
+        return mock
+
     @pytest.mark.asyncio
-    async def test_successful_command(self, executor, console):
+    async def test_successful_command(self, executor, console, mock_create):
         """Test successful command execution."""
-        with patch("asyncio.create_subprocess_exec") as mock_create:
-            # Mock process
-            mock_process = AsyncMock()
-            mock_process.returncode = 0
-            mock_process.stdout = AsyncMock()
-            mock_process.stderr = AsyncMock()
-            mock_process.stdout.read.side_effect = [b"Hello\n", b"World\n", b""]
-            mock_process.stderr.read.return_value = b""
-            mock_process.wait.return_value = None
-            mock_create.return_value = mock_process
-
-            result = await executor.run("echo 'Hello World'")
-
-            assert result.success
-            assert result.exit_code == 0
-            assert "Hello" in result.stdout
-            assert "World" in result.stdout
-            assert result.stderr == ""
-
-            # Check console output
-            assert console.print.called
+        mock_create.return_value = _mock_process(stdout=(b"Hello\n", b"World\n"))
+
+        result = await executor.run("echo 'Hello World'")
+
+        assert result.success
+        assert result.exit_code == 0
+        assert "Hello" in result.stdout
+        assert "World" in result.stdout
+        assert result.stderr == ""
+
+        # Check console output
+        assert console.print.called
 
     @pytest.mark.asyncio
-    async def test_failed_command(self, executor, console):
+    async def test_failed_command(self, executor, console, mock_create):
         """Test failed command execution."""
-        with patch("asyncio.create_subprocess_exec") as mock_create:
-            # Mock process
-            mock_process = AsyncMock()
-            mock_process.returncode = 1
-            mock_process.stdout = AsyncMock()
-            mock_process.stderr = AsyncMock()
-            mock_process.stdout.read.return_value = b""
-            mock_process.stderr.read.side_effect = [b"Error occurred\n", b""]
-            mock_process.wait.return_value = None
-            mock_create.return_value = mock_process
-
-            result = await executor.run("false")
-
-            assert not result.success
-            assert result.exit_code == 1
-            assert "Error occurred" in result.stderr
-            assert console.print.called
+        mock_create.return_value = _mock_process(
+            returncode=1, stderr=(b"Error occurred\n",)
+        )
+
+        result = await executor.run("false")
+
+        assert not result.success
+        assert result.exit_code == 1
+        assert "Error occurred" in result.stderr
+        assert console.print.called
 
     @pytest.mark.asyncio
-    async def test_command_not_found(self, executor, console):
+    async def test_command_not_found(self, executor, console, mock_create):
         """Test command not found error."""
-        with patch("asyncio.create_subprocess_exec") as mock_create:
-            mock_create.side_effect = FileNotFoundError("Command not found")
+        mock_create.side_effect = FileNotFoundError("Command not found")
 
-            result = await executor.run("nonexistent-command")
+        result = await executor.run("nonexistent-command")
 
-            assert not result.success
-            assert result.exit_code == 127
-            assert "Command not found" in result.stderr
-            assert console.print.called
+        assert not result.success
+        assert result.exit_code == 127
+        assert "Command not found" in result.stderr
+        assert console.print.called
 
     @pytest.mark.asyncio
-    async def test_permission_denied(self, executor, console):
+    async def test_permission_denied(self, executor, console, mock_create):
         """Test permission denied error."""
-        with patch("asyncio.create_subprocess_exec") as mock_create:
-            mock_create.side_effect = PermissionError("Permission denied")
+        mock_create.side_effect = PermissionError("Permission denied")
 
-            result = await executor.run("/root/protected")
+        result = await executor.run("/root/protected")
 
-            assert not result.success
-            assert result.exit_code == 126
-            assert "Permission denied" in result.stderr
-            assert console.print.called
+        assert not result.success
+        assert result.exit_code == 126
+        assert "Permission denied" in result.stderr
+        assert console.print.called
 
     @pytest.mark.asyncio
     @pytest.mark.slow
-    async def test_timeout(self, executor, console):
+    async def test_timeout(self, executor, console, mock_create):
         """Test command timeout."""
-        with patch("asyncio.create_subprocess_exec") as mock_create:
-            # Mock process that times out
-            mock_process = AsyncMock()
-            mock_process.returncode = None
-            mock_process.stdout = AsyncMock()
-            mock_process.stderr = AsyncMock()
-            mock_process.stdout.read.return_value = b""
-            mock_process.stderr.read.return_value = b""
-            mock_process.wait.return_value = None
-            mock_process.kill = MagicMock()  # Use MagicMock for kill
-            mock_create.return_value = mock_process
-
-            with patch("asyncio.wait_for", side_effect=asyncio.TimeoutError):
-                result = await executor.run("sleep 100", timeout=0.1)
-
-            assert not result.success
-            assert result.timed_out
-            assert result.exit_code == -1
-            mock_process.kill.assert_called_once()
+        # Mock process that only exits once it is killed
+        killed = asyncio.Event()
+        mock_process = _mock_process(returncode=None)
+        mock_process.wait.side_effect = killed.wait
+        mock_process.kill.side_effect = killed.set
+        mock_create.return_value = mock_process
+
+        result = await executor.run("sleep 100", timeout=0.1)
+
+        assert not result.success
+        assert result.timed_out
+        assert result.exit_code == -1
+        mock_process.kill.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_keyboard_interrupt(self, executor, console):
+    @pytest.mark.slow
+    async def test_timeout_cancels_blocked_readers(
+        self, executor, console, mock_create
+    ):
+        """Test readers blocked on an open pipe are cancelled on timeout."""
+        cancelled = []
+
+        async def read_forever(*args):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        killed = asyncio.Event()
+        mock_process = _mock_process(returncode=None)
+        mock_process.stdout.read.side_effect = read_forever
+        mock_process.stderr.read.side_effect = read_forever
+        mock_process.wait.side_effect = killed.wait
+        mock_process.kill.side_effect = killed.set
+        mock_create.return_value = mock_process
+
+        result = await executor.run("sleep 100", timeout=0.1)
+
+        assert result.timed_out
+        assert cancelled == [True, True]
+
+    @pytest.mark.asyncio
+    async def test_keyboard_interrupt(self, executor, console, mock_create):
         """Test keyboard interrupt handling."""
-        with patch("asyncio.create_subprocess_exec") as mock_create:
-            mock_create.side_effect = KeyboardInterrupt()
+        mock_create.side_effect = KeyboardInterrupt()
 
-            result = await executor.run("long-running-command")
+        result = await executor.run("long-running-command")
 
-            assert not result.success
-            assert result.interrupted
-            assert result.exit_code == 130
+        assert not result.success
+        assert result.interrupted
+        assert result.exit_code == 130
 
     @pytest.mark.asyncio
-    async def test_list_command(self, executor, console):
+    async def test_list_command(self, executor, console, mock_create):
         """Test command as list of arguments."""
-        with patch("asyncio.create_subprocess_exec") as mock_create:
-            # Mock process
-            mock_process = AsyncMock()
-            mock_process.returncode = 0
-            mock_process.stdout = AsyncMock()
-            mock_process.stderr = AsyncMock()
-            mock_process.stdout.read.side_effect = [b"file.txt\n", b""]
-            mock_process.stderr.read.return_value = b""
-            mock_process.wait.return_value = None
-            mock_create.return_value = mock_process
-
-            result = await executor.run(["ls", "-la", "/tmp"])
-
-            assert result.success
-            mock_create.assert_called_once()
-            # Check that list was passed correctly to exec
-            call_args = mock_create.call_args[0]
-            assert call_args == ("ls", "-la", "/tmp")
+        mock_create.return_value = _mock_process(stdout=(b"file.txt\n",))
+
+        result = await executor.run(["ls", "-la", "/tmp"])
+
+        assert result.success
+        mock_create.assert_called_once()
+        # Check that list was passed correctly to exec
+        call_args = mock_create.call_args[0]
+        assert call_args == ("ls", "-la", "/tmp")
 
     @pytest.mark.asyncio
-    async def test_custom_env(self, executor, console):
+    async def test_list_command_never_uses_shell(
+        self, executor, console, mock_create, monkeypatch
+    ):
+        """Test that a list command skips the shell even with shell features on."""
+        mock_shell = AsyncMock()
+        monkeypatch.setattr(asyncio, "create_subprocess_shell", mock_shell)
+        mock_create.return_value = _mock_process(stdout=(b"a b\n",))
+
+        result = await executor.run(["echo", "a b"], allow_shell_features=True)
+
+        assert result.success
+        mock_shell.assert_not_called()
+        # The argument containing a space reaches the process intact
+        assert mock_create.call_args[0] == ("echo", "a b")
+
+    @pytest.mark.asyncio
+    async def test_custom_env(self, executor, console, mock_create):
         """Test command with custom environment variables."""
-        with patch("asyncio.create_subprocess_exec") as mock_create:
-            # Mock process
-            mock_process = AsyncMock()
-            mock_process.returncode = 0
-            mock_process.stdout = AsyncMock()
-            mock_process.stderr = AsyncMock()
-            mock_process.stdout.read.side_effect = [b"VALUE\n", b""]
-            mock_process.stderr.read.return_value = b""
-            mock_process.wait.return_value = None
-            mock_create.return_value = mock_process
-
-            custom_env = {"MY_VAR": "VALUE"}
-            result = await executor.run("echo test", env=custom_env)
-
-            assert result.success
-            mock_create.assert_called_once()
-            # Check that env was passed
-            call_kwargs = mock_create.call_args[1]
-            assert "env" in call_kwargs
-            assert "MY_VAR" in call_kwargs["env"]
+        mock_create.return_value = _mock_process(stdout=(b"VALUE\n",))
+
+        custom_env = {"MY_VAR": "VALUE"}
+        result = await executor.run("echo test", env=custom_env)
+
+        assert result.success
+        mock_create.assert_called_once()
+        # Check that env was passed
+        call_kwargs = mock_create.call_args[1]
+        assert "env" in call_kwargs
+        assert "MY_VAR" in call_kwargs["env"]
 
     @pytest.mark.asyncio
-    async def test_custom_cwd(self, executor, console):
+    async def test_inherits_environment_without_overrides(
+        self, executor, console, mock_create
+    ):
+        """Test that the parent environment is inherited, not copied, by default."""
+        mock_create.return_value = _mock_process()
+
+        result = await executor.run("true")
+
+        assert result.success
+        assert mock_create.call_args[1]["env"] is None
+
+    @pytest.mark.asyncio
+    async def test_custom_cwd(self, executor, console, mock_create):
         """Test command with custom working directory."""
-        with patch("asyncio.create_subprocess_exec") as mock_create:
-            # Mock process
-            mock_process = AsyncMock()
-            mock_process.returncode = 0
-            mock_process.stdout = AsyncMock()
-            mock_process.stderr = AsyncMock()
-            mock_process.stdout.read.side_effect = [b"/tmp\n", b""]
-            mock_process.stderr.read.return_value = b""
-            mock_process.wait.return_value = None
-            mock_create.return_value = mock_process
-
-            result = await executor.run("pwd", cwd="/tmp")
-
-            assert result.success
-            mock_create.assert_called_once()
-            # Check that cwd was passed
-            call_kwargs = mock_create.call_args[1]
-            assert call_kwargs["cwd"] == "/tmp"
+        mock_create.return_value = _mock_process(stdout=(b"/tmp\n",))
+
+        result = await executor.run("pwd", cwd="/tmp")
+
+        assert result.success
+        mock_create.assert_called_once()
+        # Check that cwd was passed
+        call_kwargs = mock_create.call_args[1]
+        assert call_kwargs["cwd"] == "/tmp"
 
     @pytest.mark.asyncio
-    async def test_no_streaming(self, console):
+    async def test_no_streaming(self, console, mock_create):
         """Test executor without output streaming."""
         executor = SubprocessExecutor(console=console, stream_output=False)
 
-        with patch("asyncio.create_subprocess_exec") as mock_create:
-            # Mock process
-            mock_process = AsyncMock()
-            mock_process.returncode = 0
-            mock_process.stdout = AsyncMock()
-            mock_process.stderr = AsyncMock()
-            mock_process.stdout.read.side_effect = [b"Output\n", b""]
-            mock_process.stderr.read.return_value = b""
-            mock_process.wait.return_value = None
-            mock_create.return_value = mock_process
+        mock_process = _mock_process(stdout=(b"Output\nMore output\n",))
+        mock_create.return_value = mock_process
 
-            result = await executor.run("echo 'Output'")
+        result = await executor.run("echo 'Output'")
 
-            assert result.success
-            assert "Output" in result.stdout
-            # Console should not be called when streaming is disabled
-            console.print.assert_not_called()
+        assert result.success
+        assert result.stdout == "Output\nMore output"
+        # Console should not be called when streaming is disabled
+        console.print.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_binary_output_handling(self, executor, console):
+    @pytest.mark.slow
+    async def test_no_streaming_timeout_keeps_partial_output(
+        self, console, mock_create
+    ):
+        """Test output read before a timeout is kept when not streaming."""
+        executor = SubprocessExecutor(console=console, stream_output=False)
+
+        pending = [b"partial\n"]
+
+        async def read_then_block(n=-1):
+            # Like StreamReader.read(): a sized read returns buffered output,
+            # read() waits for EOF, which a hung process never sends
+            if n > 0 and pending:
+                return pending.pop()
+            await asyncio.Event().wait()
+
+        killed = asyncio.Event()
+        mock_process = _mock_process(returncode=None)
+        mock_process.stdout.read.side_effect = read_then_block
+        mock_process.stderr.read.side_effect = asyncio.Event().wait
+        mock_process.wait.side_effect = killed.wait
+        mock_process.kill.side_effect = killed.set
+        mock_create.return_value = mock_process
+
+        result = await executor.run("slow-command", timeout=0.1)
+
+        assert result.timed_out
+        assert result.stdout == "partial"
+
+    @pytest.mark.asyncio
+    async def test_binary_output_handling(self, executor, console, mock_create):
         """Test handling of binary output that can't be decoded."""
-        with patch("asyncio.create_subprocess_exec") as mock_create:
-            # Mock process with binary output
-            mock_process = AsyncMock()
-            mock_process.returncode = 0
-            mock_process.stdout = AsyncMock()
-            mock_process.stderr = AsyncMock()
-            # Invalid UTF-8 sequence
-            mock_process.stdout.read.side_effect = [b"\xff\xfe\xfd\n", b""]
-            mock_process.stderr.read.return_value = b""
-            mock_process.wait.return_value = None
-            mock_create.return_value = mock_process
-
-            result = await executor.run("cat binary_file")
-
-            assert result.success
-            # Should handle binary data gracefully
-            assert result.stdout  # Should have some output
+        # Mock process with an invalid UTF-8 sequence on stdout
+        mock_create.return_value = _mock_process(stdout=(b"\xff\xfe\xfd\n",))
+
+        result = await executor.run("cat binary_file")
+
+        assert result.success
+        # Should handle binary data gracefully
+        assert result.stdout  # Should have some output
+
+    @pytest.mark.asyncio
+    async def test_chunk_lines_displayed_in_one_print(
+        self, executor, console, mock_create
+    ):
+        """Test all lines completed by one read are printed together."""
+        mock_create.return_value = _mock_process(stdout=(b"one\ntwo\nthr", b"ee\n"))
+
+        result = await executor.run("printf lines")
+
+        assert result.stdout == "one\ntwo\nthree"
+        printed = [call.args[0].plain for call in console.print.call_args_list]
+        assert printed[1:3] == ["one\ntwo", "three"]
+
+    @pytest.mark.asyncio
+    async def test_lines_split_across_chunks(self, executor, console, mock_create):
+        """Test that lines and UTF-8 characters split across reads are rejoined."""
+        # "é" is split between the third and fourth chunk
+        mock_create.return_value = _mock_process(
+            stdout=(b"He", b"llo\nWor", b"ld\ncaf\xc3", b"\xa9")
+        )
+
+        result = await executor.run("cat chunks")
+
+        assert result.stdout == "Hello\nWorld\ncaf\u00e9"
 
     def test_executor_initialization(self):
         """Test executor initialization with defaults."""
@@ -297,7 +378,7 @@ class TestSubprocessExecutor:
 
     def test_executor_custom_initialization(self):
         """Test executor initialization with custom values."""
-        console = Mock(spec=Console)
+        console = _StubConsole()
         executor = SubprocessExecutor(
             console=console, default_timeout=60.0, stream_output=False
         )
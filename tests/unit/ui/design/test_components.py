@@ -1,13 +1,18 @@
 """Tests for UI components and design elements."""
 
+import sys
+from dataclasses import fields
+
 import pytest
 
+from cli_patterns.ui.design import boxes, icons
 from cli_patterns.ui.design.boxes import (
     ASCII,
     BOX_STYLES,
     DOUBLE,
     HEAVY,
     ROUNDED,
+    BoxStyle,
 )
 from cli_patterns.ui.design.components import Output, Panel, ProgressBar, Prompt
 from cli_patterns.ui.design.icons import (
@@ -16,6 +21,7 @@ from cli_patterns.ui.design.icons import (
     ICON_SETS,
     NERD_FONT_ICONS,
     UNICODE_ICONS,
+    IconSet,
     get_icon_set,
 )
 from cli_patterns.ui.design.tokens import (
@@ -27,6 +33,43 @@ from cli_patterns.ui.design.tokens import (
 
 pytestmark = pytest.mark.design
 
+BOX_STYLE_FIELDS = frozenset(
+    {
+        "top",
+        "bottom",
+        "left",
+        "right",
+        "top_left",
+        "top_right",
+        "bottom_left",
+        "bottom_right",
+        "horizontal_down",
+        "horizontal_up",
+        "vertical_right",
+        "vertical_left",
+        "cross",
+    }
+)
+"""Characters every box style must define."""
+
+ICON_SET_FIELDS = frozenset(
+    {
+        "success",
+        "error",
+        "warning",
+        "info",
+        "running",
+        "folder",
+        "file",
+        "arrow_right",
+        "arrow_down",
+        "check",
+        "cross",
+        "bullet",
+    }
+)
+"""Icons every icon set must define."""
+
 
 class TestPanelComponent:
     """Tests for Panel component default values."""
@@ -136,6 +179,18 @@ class TestOutputComponent:
         assert output.info_status == StatusToken.SUCCESS
 
 
+class TestComponentSlots:
+    """Tests for the memory layout of the component dataclasses."""
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 10), reason="dataclass(slots=True) needs Python 3.10+"
+    )
+    @pytest.mark.parametrize("component_cls", [Panel, ProgressBar, Prompt, Output])
+    def test_component_uses_slots(self, component_cls):
+        """Test components carry no per-instance __dict__."""
+        assert not hasattr(component_cls(), "__dict__")
+
+
 class TestBoxStyles:
     """Tests for box drawing styles."""
 
@@ -212,32 +267,20 @@ class TestBoxStyles:
         assert BOX_STYLES["ascii"] is ASCII
         assert BOX_STYLES["double"] is DOUBLE
 
+    def test_box_styles_registry_has_every_style(self):
+        """Test every BoxStyle defined in the module is registered exactly once."""
+        defined = [v for v in vars(boxes).values() if isinstance(v, BoxStyle)]
+
+        assert {id(style) for style in BOX_STYLES.values()} == set(map(id, defined))
+        assert len(BOX_STYLES) == len(defined)
+
     def test_all_box_styles_complete(self):
         """Test all box styles have complete character sets."""
-        required_fields = [
-            "top",
-            "bottom",
-            "left",
-            "right",
-            "top_left",
-            "top_right",
-            "bottom_left",
-            "bottom_right",
-            "horizontal_down",
-            "horizontal_up",
-            "vertical_right",
-            "vertical_left",
-            "cross",
-        ]
-
         for style_name, style in BOX_STYLES.items():
-            for field in required_fields:
-                assert hasattr(
-                    style, field
-                ), f"Style '{style_name}' missing field '{field}'"
-                assert getattr(
-                    style, field
-                ), f"Style '{style_name}' has empty field '{field}'"
+            missing = BOX_STYLE_FIELDS - {field.name for field in fields(style)}
+            assert not missing, f"Style '{style_name}' missing fields {missing}"
+            empty = {name for name in BOX_STYLE_FIELDS if not getattr(style, name)}
+            assert not empty, f"Style '{style_name}' has empty fields {empty}"
 
 
 class TestIconSets:
@@ -314,29 +357,21 @@ class TestIconSets:
         assert ICON_SETS["ascii"] is ASCII_ICONS
         assert ICON_SETS["nerd"] is NERD_FONT_ICONS
 
+    def test_icon_sets_registry_has_every_set(self):
+        """Test every IconSet defined in the module is registered exactly once."""
+        defined = [v for v in vars(icons).values() if isinstance(v, IconSet)]
+
+        assert {id(icon_set) for icon_set in ICON_SETS.values()} == set(
+            map(id, defined)
+        )
+        assert len(ICON_SETS) == len(defined)
+
     def test_all_icon_sets_complete(self):
         """Test all icon sets have complete icon mappings."""
-        required_fields = [
-            "success",
-            "error",
-            "warning",
-            "info",
-            "running",
-            "folder",
-            "file",
-            "arrow_right",
-            "arrow_down",
-            "check",
-            "cross",
-            "bullet",
-        ]
-
+        # Note: Don't check for non-empty values as some icon sets might use empty strings
         for set_name, icon_set in ICON_SETS.items():
-            for field in required_fields:
-                assert hasattr(
-                    icon_set, field
-                ), f"Icon set '{set_name}' missing field '{field}'"
-                # Note: Don't check for non-empty values as some icon sets might use empty strings
+            missing = ICON_SET_FIELDS - {field.name for field in fields(icon_set)}
+            assert not missing, f"Icon set '{set_name}' missing fields {missing}"
 
 
 class TestGetIconSetFunction:
@@ -13,6 +13,7 @@ import yaml
 from cli_patterns.config.theme_loader import (
     ThemeLoadError,
     apply_theme_from_env,
+    clear_theme_cache,
     load_theme_from_yaml,
     load_user_themes,
 )
@@ -341,9 +342,69 @@ class TestThemeRegistry:
         assert themes[-1] == "zebra"
 
 
+def _theme_data(name: str) -> dict[str, object]:
+    """Build a complete theme document with the given name."""
+    return {
+        "name": name,
+        "categories": {token.value: "red" for token in CategoryToken},
+        "hierarchies": {token.value: "bold" for token in HierarchyToken},
+        "statuses": {token.value: "green" for token in StatusToken},
+        "emphases": {token.value: "dim" for token in EmphasisToken},
+    }
+
+
 class TestThemeLoader:
     """Tests for theme loading functionality."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        """Start and finish every test with an empty parse cache."""
+        clear_theme_cache()
+        yield
+        clear_theme_cache()
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path) -> None:
+        """Test reloading an unchanged file reuses the parsed document."""
+        theme_path = tmp_path / "theme.yaml"
+        theme_path.write_text(yaml.dump(_theme_data("cached")))
+
+        with patch(
+            "cli_patterns.config.theme_loader.yaml.load", wraps=yaml.load
+        ) as load:
+            first = load_theme_from_yaml(theme_path)
+            second = load_theme_from_yaml(theme_path)
+
+        assert load.call_count == 1
+        # Themes are mutable, so each load still builds its own instance
+        assert first is not second
+        assert first.categories == second.categories
+
+    def test_modified_file_is_reparsed(self, tmp_path) -> None:
+        """Test a changed file is parsed again instead of served from cache."""
+        theme_path = tmp_path / "theme.yaml"
+        theme_path.write_text(yaml.dump(_theme_data("before")))
+        assert load_theme_from_yaml(theme_path).name == "before"
+
+        theme_path.write_text(yaml.dump(_theme_data("after_edit")))
+
+        assert load_theme_from_yaml(theme_path).name == "after_edit"
+
+    def test_relative_path_cached_per_directory(self, tmp_path, monkeypatch) -> None:
+        """Test the same relative name in two directories loads each file."""
+        first_dir = tmp_path / "first"
+        second_dir = tmp_path / "second"
+        for directory, name in ((first_dir, "theme_a"), (second_dir, "theme_b")):
+            directory.mkdir()
+            theme_file = directory / "theme.yaml"
+            theme_file.write_text(yaml.dump(_theme_data(name)))
+            # Identical size and mtime, so only the path tells them apart
+            os.utime(theme_file, ns=(0, 0))
+
+        monkeypatch.chdir(first_dir)
+        assert load_theme_from_yaml("theme.yaml").name == "theme_a"
+        monkeypatch.chdir(second_dir)
+        assert load_theme_from_yaml("theme.yaml").name == "theme_b"
+
     def test_load_theme_from_yaml_success(self) -> None:
         """Test loading valid theme from YAML file."""
         theme_data = {
@@ -0,0 +1,56 @@
+"""Tests for the interactive shell's event loop selection."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import types
+
+import pytest
+
+from cli_patterns.ui.shell import _run_event_loop
+
+pytestmark = pytest.mark.ui
+
+
+class TestRunEventLoop:
+    """Test running the shell coroutine with and without uvloop."""
+
+    def test_runs_without_uvloop(self, monkeypatch) -> None:
+        """Test the standard asyncio loop is used when uvloop is missing."""
+        # A None entry makes the import raise ImportError
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+        ran = []
+
+        async def main() -> None:
+            ran.append(True)
+
+        _run_event_loop(main())
+
+        assert ran == [True]
+
+    def test_runs_with_uvloop_lacking_run(self, monkeypatch) -> None:
+        """Test a uvloop older than 0.18 (no uvloop.run) doesn't crash startup."""
+        old_uvloop = types.ModuleType("uvloop")
+        old_uvloop.new_event_loop = asyncio.new_event_loop  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, "uvloop", old_uvloop)
+        ran = []
+
+        async def main() -> None:
+            ran.append(True)
+
+        _run_event_loop(main())
+
+        assert ran == [True]
+
+    def test_runs_on_uvloop_when_installed(self) -> None:
+        """Test the coroutine runs on a real uvloop loop when it is installed."""
+        uvloop = pytest.importorskip("uvloop")
+        loops = []
+
+        async def main() -> None:
+            loops.append(asyncio.get_running_loop())
+
+        _run_event_loop(main())
+
+        assert isinstance(loops[0], uvloop.Loop)